@@ -2,7 +2,8 @@
 Contextual unification module for applying simplified unification rules.
 """
 
-from typing import Dict, List, Any
+import time
+from typing import Dict, List, Any, Optional
 import music21
 from .utils import ProcessingContext, UnificationResult
 from .exceptions import UnificationError
@@ -40,7 +41,6 @@ class ContextualUnifier:
         Raises:
             UnificationError: If unification fails
         """
-        import time
         start_time = time.time()
         
         try:
@@ -128,7 +128,8 @@ class ContextualUnifier:
             
             # Rule 2: Apply Soprano-only dynamics to all voices (traditional rule)
             if 'Soprano' in voice_scores:
-                soprano_only_dynamics = self._find_soprano_only_dynamics(voice_scores)
+                soprano_only_dynamics = self._find_soprano_only_dynamics(
+                    voice_scores, cross_ref['dynamics_by_voice'].get('Soprano'))
                 for dynamic_info in soprano_only_dynamics:
                     self._apply_dynamic_to_all_voices(dynamic_info, voice_scores)
                     elements_unified += 1
@@ -227,6 +228,7 @@ class ContextualUnifier:
         """Cross-reference elements between voice scores for analysis."""
         common_elements = {'dynamics': [], 'lyrics': [], 'spanners': []}
         voice_specific_elements = {}
+        dynamics_by_voice = {}
         
         # Analyze each voice for common elements
         for voice_name, score in voice_scores.items():
@@ -234,6 +236,7 @@ class ContextualUnifier:
             
             # Find dynamics
             dynamics = self._extract_dynamics_from_score(score)
+            dynamics_by_voice[voice_name] = dynamics
             for dynamic in dynamics:
                 # Check if this dynamic appears in other voices at the same position
                 if self._is_dynamic_common(dynamic, voice_scores, voice_name):
@@ -245,6 +248,7 @@ class ContextualUnifier:
         return {
             'common_elements': common_elements,
             'voice_specific_elements': voice_specific_elements,
+            'dynamics_by_voice': dynamics_by_voice,
             'potential_unifications': []
         }
     
@@ -299,12 +303,15 @@ class ContextualUnifier:
             # If placement setting fails, use defaults
             dynamic_obj.placement = 'below'
     
-    def _find_soprano_only_dynamics(self, voice_scores: Dict[str, music21.stream.Score]) -> List[dict]:
+    def _find_soprano_only_dynamics(self, voice_scores: Dict[str, music21.stream.Score],
+                                    soprano_dynamics: Optional[List[dict]] = None) -> List[dict]:
         """Find dynamics that appear only in the Soprano voice."""
         if 'Soprano' not in voice_scores:
             return []
         
-        soprano_dynamics = self._extract_dynamics_from_score(voice_scores['Soprano'])
+        # Reuse the Soprano dynamics already extracted by cross_reference_elements when given
+        if soprano_dynamics is None:
+            soprano_dynamics = self._extract_dynamics_from_score(voice_scores['Soprano'])
         soprano_only = []
         
         for dynamic in soprano_dynamics:
@@ -328,6 +335,12 @@ class ContextualUnifier:
         # Get all voice names for analysis
         voice_names = list(voice_scores.keys())
         
+        # Index each voice's measures by number once instead of scanning per note
+        measure_indexes = {
+            voice_name: self._build_measure_index(score)
+            for voice_name, score in voice_scores.items()
+        }
+        
         # Analyze each measure across all voices
         for voice_name, score in voice_scores.items():
             for part in score.parts:
@@ -340,7 +353,7 @@ class ContextualUnifier:
                     # For each note with lyrics, check if other voices at same position need the lyric
                     for note_info in notes_with_lyrics:
                         gap_candidates = self._find_matching_notes_without_lyrics(
-                            note_info, measure_number, voice_scores, voice_name
+                            note_info, measure_number, measure_indexes, voice_name
                         )
                         
                         for candidate in gap_candidates:
@@ -401,17 +414,17 @@ class ContextualUnifier:
         return notes_with_lyrics
     
     def _find_matching_notes_without_lyrics(self, note_info: dict, measure_number: int,
-                                          voice_scores: Dict[str, music21.stream.Score],
+                                          measure_indexes: Dict[str, Dict[int, music21.stream.Measure]],
                                           source_voice: str) -> List[dict]:
         """Find notes in other voices using deterministic time-window matching."""
         candidates = []
         
-        for voice_name, score in voice_scores.items():
+        for voice_name, measure_index in measure_indexes.items():
             if voice_name == source_voice:
                 continue
                 
             # Find the corresponding measure in this voice
-            target_measure = self._find_measure_in_score(score, measure_number)
+            target_measure = measure_index.get(measure_number)
             if not target_measure:
                 continue
             
@@ -432,19 +445,14 @@ class ContextualUnifier:
         
         return candidates
     
-    def _find_measure_in_score(self, score: music21.stream.Score, measure_number: int):
-        """Find a specific measure by number in a score."""
+    def _build_measure_index(self, score: music21.stream.Score) -> Dict[int, music21.stream.Measure]:
+        """Map measure numbers to measures, keeping the first match across parts."""
+        measure_index = {}
         for part in score.parts:
-            for measure in part.getElementsByClass('Measure'):
-                if hasattr(measure, 'number') and measure.number == measure_number:
-                    return measure
-                # Fallback for measures without explicit numbers
-                elif not hasattr(measure, 'number'):
-                    # Assume measures are in order, use index
-                    measures = list(part.getElementsByClass('Measure'))
-                    if len(measures) >= measure_number:
-                        return measures[measure_number - 1]
-        return None
+            for measure_idx, measure in enumerate(part.getElementsByClass('Measure')):
+                measure_number = measure.number if hasattr(measure, 'number') else measure_idx + 1
+                measure_index.setdefault(measure_number, measure)
+        return measure_index
     
     def _find_candidates_in_time_window(self, note_info: dict, target_measure) -> List[music21.note.Note]:
         """Find all notes that start during the source note's duration."""
@@ -453,12 +461,14 @@ class ContextualUnifier:
         source_end = source_start + note_info['duration']
         
         for note in target_measure.getElementsByClass('Note'):
-            if (hasattr(note, 'offset') and note.offset is not None and
+            # offset is a property resolved through the note's site, so read it once
+            note_offset = getattr(note, 'offset', None)
+            if (note_offset is not None and
                 hasattr(note, 'duration') and note.duration is not None and
                 not note.lyrics):  # No existing lyrics
                 
                 # Check if note starts within the source note's time window
-                if source_start <= note.offset < source_end:
+                if source_start <= note_offset < source_end:
                     candidates.append(note)
         
         return candidates
@@ -517,12 +527,13 @@ class ContextualUnifier:
         if not candidates:
             return None
         
-        # Sort by: duration (desc), then offset (asc), then object id for consistency
-        return sorted(candidates, key=lambda n: (
+        # Rank by: duration (desc), then offset (asc), then object id for consistency;
+        # only the winner is needed, so take the minimum instead of sorting
+        return min(candidates, key=lambda n: (
             -n.duration.quarterLength,  # Longest duration first
             n.offset,                   # Earliest start time first
             id(n)                       # Consistent ordering for identical cases
-        ))[0]
+        ))
     
     def _find_tempo_markings(self, voice_scores: Dict[str, music21.stream.Score]) -> List[dict]:
         """Find tempo markings in any voice."""
@@ -102,10 +102,12 @@ class DirectVoiceExtractor:
         # Extract measures for this voice
         source_part = self.original_score.parts[config.part_index]
         
+        voice_measures = []
         for measure in source_part.getElementsByClass('Measure'):
             voice_measure = self._extract_voice_from_measure(measure, config)
             if voice_measure and len(voice_measure) > 0:
-                voice_part.append(voice_measure)
+                voice_measures.append(voice_measure)
+        voice_part.append(voice_measures)
         
         # Extract and apply slurs for this voice
         self._extract_slurs_for_voice(source_part, voice_part, config)
@@ -151,8 +153,7 @@ class DirectVoiceExtractor:
         
         # Extract voice-specific notes
         voice_notes = self._extract_voice_notes(source_measure, config)
-        for note in voice_notes:
-            voice_measure.append(note)
+        voice_measure.append(voice_notes)
         
         # Extract lyrics for this voice (may come from different voice)
         self._add_lyrics_to_measure(voice_measure, source_measure, config)
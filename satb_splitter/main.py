@@ -2,9 +2,10 @@
 Main entry point for SATB voice splitting with copy-and-remove architecture.
 """
 
+import re
 import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 import music21
 from .utils import save_voice_scores
 from .score_processor import ScoreProcessor
@@ -12,14 +13,20 @@ from .converter import convert_mscz_to_musicxml, check_mscore_available
 from .exceptions import ProcessingError, InvalidScoreError
 
 
-def split_satb_voices(input_file: str,
-                     output_dir: Optional[str] = None) -> Dict[str, music21.stream.Score]:
+def split_satb_voices(input_file: Union[str, music21.stream.Score],
+                     output_dir: Optional[str] = None,
+                     base_name: Optional[str] = None) -> Dict[str, music21.stream.Score]:
     """
     Split SATB score into individual voice parts using copy-and-remove approach.
     
     Args:
-        input_file: Path to input .mscz or .musicxml file
+        input_file: Path to input .mscz or .musicxml file, or an already-parsed Score.
+            A parsed Score is used in place, not copied: its notes pick up spanner
+            sites and the returned scores' spanners reference them. Pass a
+            copy.deepcopy of it if it must stay untouched.
         output_dir: Directory for output files (optional)
+        base_name: Base name for output files (optional). Defaults to the input
+            file's stem, or to the score's title when a parsed Score is given.
         
     Returns:
         Dictionary mapping voice names to Score objects
@@ -31,7 +38,8 @@ def split_satb_voices(input_file: str,
     
     # Handle file conversion if needed
     working_file = input_file
-    if input_file.lower().endswith('.mscz'):
+    is_parsed_score = isinstance(input_file, music21.stream.Score)
+    if not is_parsed_score and input_file.lower().endswith('.mscz'):
         # Convert .mscz to .musicxml
         working_file = convert_mscz_to_musicxml(input_file)
     
@@ -47,13 +55,24 @@ def split_satb_voices(input_file: str,
     
     # Save output files if output directory is specified
     if output_dir:
-        input_path = Path(input_file)
-        base_name = input_path.stem
+        if base_name is None:
+            if is_parsed_score:
+                base_name = _base_name_from_title(input_file)
+            else:
+                base_name = Path(input_file).stem
         save_voice_scores(result.voice_scores, output_dir, base_name)
     
     return result.voice_scores
 
 
+def _base_name_from_title(score: music21.stream.Score) -> str:
+    """Derive an output file base name from a score's title."""
+    title = score.metadata.title if score.metadata and score.metadata.title else ""
+    # Titles may contain path separators or other characters that aren't valid in filenames
+    base_name = re.sub(r'[\\/:*?"<>|\x00-\x1f]+', '-', title).strip(' .-')
+    return base_name or "score"
+
+
 def main():
     """Main entry point for the satb-split command."""
     if len(sys.argv) != 2:
@@ -4,13 +4,15 @@ Score processor module for orchestrating the SATB splitting pipeline.
 
 import copy
 import time
-from typing import Dict
+from typing import Dict, Optional, Union
 import music21
-from .utils import ProcessingContext, ProcessingResult, ValidationResult, load_score
+from .utils import (ProcessingContext, ProcessingResult, ValidationResult, VoiceLocation,
+                    VoiceMapping, load_score)
 from .voice_identifier import VoiceIdentifier
 from .voice_remover import VoiceRemover
 from .staff_simplifier import StaffSimplifier
 from .contextual_unifier import ContextualUnifier
+from .spanner_processor import SpannerProcessor
 from .exceptions import ProcessingError, InvalidScoreError
 
 
@@ -21,12 +23,14 @@ class ScoreProcessor:
         """Initialize the score processor."""
         pass
         
-    def process_satb_score(self, input_file: str) -> ProcessingResult:
+    def process_satb_score(self, input_file: Union[str, music21.stream.Score]) -> ProcessingResult:
         """
         Process SATB score through complete pipeline.
         
         Args:
-            input_file: Path to input score file
+            input_file: Path to input score file, or an already-parsed Score.
+                A parsed Score is used in place, not copied: its notes pick up
+                spanner sites and the result's spanners reference them.
             
         Returns:
             ProcessingResult with voice scores and metadata
@@ -42,7 +46,10 @@ class ScoreProcessor:
         try:
             # Step 1: Load and validate input score
             processing_steps.append("Loading input score")
-            original_score = load_score(input_file)
+            if isinstance(input_file, music21.stream.Score):
+                original_score = input_file
+            else:
+                original_score = load_score(input_file)
             
             validation_result = self.validate_input(original_score)
             if not validation_result.valid:
@@ -62,9 +69,9 @@ class ScoreProcessor:
                 voice_mapping=voice_mapping
             )
             
-            # Step 3: Create complete copies for each voice
+            # Step 3: Create a copy for each voice, skipping content it will not keep
             processing_steps.append("Creating voice copies")
-            voice_scores = self.create_voice_copies(original_score)
+            voice_scores = self.create_voice_copies(original_score, voice_mapping)
             
             # Step 4: Remove unwanted voices from each copy
             processing_steps.append("Removing unwanted voices")
@@ -93,7 +100,6 @@ class ScoreProcessor:
             
             # Step 6: Process spanners with voice-aware filtering
             processing_steps.append("Processing spanners with voice context")
-            from .spanner_processor import SpannerProcessor
             spanner_processor = SpannerProcessor()
             
             # Extract spanners from original score with context
@@ -123,8 +129,13 @@ class ScoreProcessor:
                 errors.extend(output_validation.errors)
             warnings.extend(output_validation.warnings)
             
-            # Calculate statistics
-            statistics = self._calculate_statistics(original_score, voice_scores)
+            # Calculate statistics, reusing the note counts output validation just took
+            note_counts = {
+                voice_name: voice_details['note_count']
+                for voice_name, voice_details in output_validation.details.items()
+                if 'note_count' in voice_details
+            }
+            statistics = self._calculate_statistics(original_score, voice_scores, note_counts)
             
             processing_time = time.time() - start_time
             
@@ -240,6 +251,7 @@ class ScoreProcessor:
             # 3. Validate MusicXML-specific structure for each part
             total_notes = 0
             valid_parts = 0
+            total_measures = 0
             
             for i, part in enumerate(score.parts):
                 part_errors = []
@@ -284,6 +296,7 @@ class ScoreProcessor:
                 # Validate measure structure
                 try:
                     measures = part.getElementsByClass(music21.stream.Measure)
+                    total_measures = max(total_measures, len(measures))
                     if not measures:
                         part_warnings.append(f"Part {i+1} has no explicit measures")
                     else:
@@ -327,15 +340,7 @@ class ScoreProcessor:
             except Exception as e:
                 warnings.append(f"Metadata validation error: {e}")
             
-            # 6. Check for measures across all parts
-            total_measures = 0
-            for part in score.parts:
-                try:
-                    measures = part.getElementsByClass(music21.stream.Measure)
-                    total_measures = max(total_measures, len(measures))
-                except Exception as e:
-                    warnings.append(f"Measure counting error in part: {e}")
-            
+            # 6. Check for measures across all parts (counted during the part checks above)
             details['total_measures'] = total_measures
             
             if total_measures == 0:
@@ -357,19 +362,32 @@ class ScoreProcessor:
                 details=details
             )
     
-    def create_voice_copies(self, original: music21.stream.Score) -> Dict[str, music21.stream.Score]:
-        """Create complete copies of score for each voice."""
+    def create_voice_copies(self, original: music21.stream.Score,
+                            voice_mapping: Optional[VoiceMapping] = None) -> Dict[str, music21.stream.Score]:
+        """
+        Create copies of score for each voice.
+        
+        Args:
+            original: Score to copy
+            voice_mapping: Optional voice mapping; when given, content that voice
+                removal would discard from a voice's copy is not copied at all
+            
+        Returns:
+            Dictionary of voice name to score copy
+        """
         voice_scores = {}
         
         voice_names = ['Soprano', 'Alto', 'Tenor', 'Bass']
         
         for voice_name in voice_names:
+            keep_voice = getattr(voice_mapping, voice_name.lower()) if voice_mapping else None
             # Create efficient score copy using music21's template method
-            voice_scores[voice_name] = self._create_efficient_score_copy(original)
+            voice_scores[voice_name] = self._create_efficient_score_copy(original, keep_voice)
         
         return voice_scores
     
-    def _create_efficient_score_copy(self, original: music21.stream.Score) -> music21.stream.Score:
+    def _create_efficient_score_copy(self, original: music21.stream.Score,
+                                     keep_voice: Optional[VoiceLocation] = None) -> music21.stream.Score:
         """Create an efficient copy of the score avoiding full deep copy."""
         # Use music21's score template for basic structure
         new_score = music21.stream.Score()
@@ -386,7 +404,7 @@ class ScoreProcessor:
                 new_score.metadata.workTitle = original.metadata.workTitle
         
         # Copy parts with selective copying
-        for original_part in original.parts:
+        for part_idx, original_part in enumerate(original.parts):
             new_part = music21.stream.Part()
             
             # Copy part-level attributes
@@ -395,12 +413,21 @@ class ScoreProcessor:
             if hasattr(original_part, 'partAbbreviation') and original_part.partAbbreviation:
                 new_part.partAbbreviation = original_part.partAbbreviation
             
+            if keep_voice is not None and part_idx != keep_voice.part_index:
+                # Voice removal drops this whole part, so an empty placeholder
+                # is enough to keep part indices aligned with the voice mapping
+                new_score.append(new_part)
+                continue
+            
+            keep_voice_id = keep_voice.voice_id if keep_voice is not None else None
+            
             # Copy essential elements efficiently using music21's built-in methods
+            part_elements = []
             for element in original_part.elements:
                 if isinstance(element, music21.stream.Measure):
                     # For measures, create new measure and copy essential content
-                    new_measure = self._copy_measure_efficiently(element)
-                    new_part.append(new_measure)
+                    new_measure = self._copy_measure_efficiently(element, keep_voice_id)
+                    part_elements.append(new_measure)
                 elif isinstance(element, (music21.clef.Clef,
                                         music21.key.KeySignature,
                                         music21.meter.TimeSignature,
@@ -408,16 +435,18 @@ class ScoreProcessor:
                     # For these simple objects, use music21's clone method if available
                     try:
                         if hasattr(element, 'clone'):
-                            new_part.append(element.clone())
+                            part_elements.append(element.clone())
                         else:
                             # Fallback to creating new instances with same properties
                             new_element = self._clone_element_efficiently(element)
                             if new_element:
-                                new_part.append(new_element)
+                                part_elements.append(new_element)
                     except Exception:
                         # If efficient copying fails, fallback to deepcopy for this element only
-                        import copy
-                        new_part.append(copy.deepcopy(element))
+                        part_elements.append(copy.deepcopy(element))
+            
+            # Append all measures in one call instead of re-indexing the part per measure
+            new_part.append(part_elements)
             
             # CRITICAL FIX: Copy spanners (including crescendos) from original part
             # Spanners are stored separately and not included in elements iteration
@@ -432,44 +461,75 @@ class ScoreProcessor:
         # The sophisticated spanner processing will handle voice-specific assignments
         pass
     
-    def _copy_measure_efficiently(self, original_measure: music21.stream.Measure) -> music21.stream.Measure:
-        """Create an efficient copy of a measure without full deep copy."""
+    def _copy_measure_efficiently(self, original_measure: music21.stream.Measure,
+                                  keep_voice_id: Optional[str] = None) -> music21.stream.Measure:
+        """
+        Create an efficient copy of a measure without full deep copy.
+        
+        Args:
+            original_measure: Measure to copy
+            keep_voice_id: Optional ID of the only voice whose contents are needed;
+                other voices are copied as empty shells with their IDs intact
+            
+        Returns:
+            Copied measure
+        """
         new_measure = music21.stream.Measure()
         
         # Copy measure number and basic properties
         if hasattr(original_measure, 'number') and original_measure.number is not None:
             new_measure.number = original_measure.number
         
-        # Copy elements efficiently
+        # Only skip other voices' contents when the kept voice is found by ID;
+        # otherwise voice removal falls back to picking a voice by index
+        if keep_voice_id is not None:
+            keep_voice_id = str(keep_voice_id)
+            if not any(str(voice.id) == keep_voice_id for voice in original_measure.voices):
+                keep_voice_id = None
+        
+        # Copy elements efficiently, collecting them so the measure is only re-indexed once
+        measure_elements = []
         for element in original_measure:
             try:
                 # Use music21's clone method if available for better performance
                 if hasattr(element, 'clone'):
-                    new_measure.append(element.clone())
+                    measure_elements.append(element.clone())
                 elif isinstance(element, music21.stream.Voice):
                     # For voices, create new voice and copy contents
                     new_voice = music21.stream.Voice()
                     new_voice.id = element.id if hasattr(element, 'id') else None
+                    voice_elements = []
+                    if keep_voice_id is not None and str(element.id) != keep_voice_id:
+                        # Voice removal discards this voice, so its contents are not needed;
+                        # keep its duration so later elements land at the same offsets
+                        new_voice.duration = music21.duration.Duration(element.duration.quarterLength)
+                        measure_elements.append(new_voice)
+                        continue
                     for voice_element in element:
                         if hasattr(voice_element, 'clone'):
-                            new_voice.append(voice_element.clone())
+                            voice_elements.append(voice_element.clone())
+                        elif isinstance(voice_element, music21.note.Rest):
+                            # Rests carry little beyond their duration, so build them directly
+                            cloned = self._clone_element_efficiently(voice_element)
+                            voice_elements.append(cloned if cloned else copy.deepcopy(voice_element))
                         else:
                             # Fallback to deepcopy for complex elements
-                            import copy
-                            new_voice.append(copy.deepcopy(voice_element))
-                    new_measure.append(new_voice)
+                            voice_elements.append(copy.deepcopy(voice_element))
+                    # Append the whole list at once so the voice is only re-indexed once
+                    new_voice.append(voice_elements)
+                    measure_elements.append(new_voice)
                 else:
                     # For other elements, try clone first, then fallback
                     cloned = self._clone_element_efficiently(element)
                     if cloned:
-                        new_measure.append(cloned)
+                        measure_elements.append(cloned)
                     else:
-                        import copy
-                        new_measure.append(copy.deepcopy(element))
+                        measure_elements.append(copy.deepcopy(element))
             except Exception:
                 # If all else fails, use deepcopy
-                import copy
-                new_measure.append(copy.deepcopy(element))
+                measure_elements.append(copy.deepcopy(element))
+        
+        new_measure.append(measure_elements)
         
         return new_measure
     
@@ -502,7 +562,19 @@ class ScoreProcessor:
                     quarterLength=element.quarterLength
                 )
             elif isinstance(element, music21.note.Rest):
-                return music21.note.Rest(quarterLength=element.quarterLength)
+                new_rest = music21.note.Rest(quarterLength=element.quarterLength)
+                new_rest.fullMeasure = element.fullMeasure
+                new_rest.stepShift = element.stepShift
+                # Keep fermatas and other markings attached to the rest
+                new_rest.expressions = [copy.deepcopy(e) for e in element.expressions]
+                new_rest.articulations = [copy.deepcopy(a) for a in element.articulations]
+                # Only carry over explicit ids; automatic ones are tied to the original object
+                if element.id != id(element):
+                    new_rest.id = element.id
+                # Keep layout position and print-object from the original rest
+                if element.hasStyleInformation:
+                    new_rest.style = copy.copy(element.style)
+                return new_rest
             elif isinstance(element, music21.chord.Chord):
                 return music21.chord.Chord(
                     notes=[n.pitch for n in element.notes],
@@ -576,7 +648,8 @@ class ScoreProcessor:
             )
     
     def _calculate_statistics(self, original_score: music21.stream.Score,
-                            voice_scores: Dict[str, music21.stream.Score]) -> dict:
+                            voice_scores: Dict[str, music21.stream.Score],
+                            note_counts: Optional[Dict[str, int]] = None) -> dict:
         """Calculate processing statistics."""
         statistics = {}
         
@@ -588,18 +661,21 @@ class ScoreProcessor:
         # Output statistics
         statistics['output_scores'] = len(voice_scores)
         
-        # Elements preserved per voice (optimize by caching flattened views)
+        # Elements preserved per voice (optimize by reusing counts already taken)
+        note_counts = note_counts or {}
         elements_preserved = {}
         for voice_name, score in voice_scores.items():
+            if voice_name in note_counts:
+                elements_preserved[voice_name] = note_counts[voice_name]
+                continue
             # Use cached flattened view for performance
             flattened_score = score.flatten()
             elements_preserved[voice_name] = len(flattened_score.notes)
         statistics['elements_preserved'] = elements_preserved
         
         # Processing efficiency metrics (more meaningful than memory usage)
-        statistics['total_elements_processed'] = sum(
-            len(score.flatten().notes) for score in voice_scores.values()
-        )
+        # Reuse the per-voice counts instead of walking every score a second time
+        statistics['total_elements_processed'] = sum(elements_preserved.values())
         statistics['average_elements_per_voice'] = (
             statistics['total_elements_processed'] / len(voice_scores)
             if voice_scores else 0
@@ -619,9 +695,6 @@ class ScoreProcessor:
         """Count the total number of voices across all parts."""
         total_voices = 0
         for part in score.parts:
-            voice_ids = set()
-            for measure in part.getElementsByClass(music21.stream.Measure):
-                for voice in measure.voices:
-                    voice_ids.add(voice.id)
+            voice_ids = {voice.id for voice in part.recurse().getElementsByClass(music21.stream.Voice)}
             total_voices += max(1, len(voice_ids))  # At least 1 voice per part
         return total_voices
\ No newline at end of file
@@ -340,7 +340,8 @@ class SpannerProcessor:
             # Process each voice using voice-aware spanner filtering
             for voice_name, voice_score in voice_scores.items():
                 voice_result = self._process_voice_spanners_with_context(
-                    voice_name, voice_score, original_spanners_with_context)
+                    voice_name, voice_score, original_spanners_with_context,
+                    all_voice_notes[voice_name])
                 processing_results['voice_results'][voice_name] = voice_result
                 processing_results['total_spanners_preserved'] += voice_result['spanners_preserved']
                 processing_results['warnings'].extend(voice_result['warnings'])
@@ -398,7 +399,8 @@ class SpannerProcessor:
         return result
     
     def _process_voice_spanners_with_context(self, voice_name: str, voice_score: Any,
-                                           spanners_with_context: List[Dict[str, Any]]) -> Dict[str, Any]:
+                                           spanners_with_context: List[Dict[str, Any]],
+                                           voice_notes: Optional[List[Any]] = None) -> Dict[str, Any]:
         """Process spanners for a specific voice using voice context information."""
         result = {
             'voice_name': voice_name,
@@ -411,8 +413,9 @@ class SpannerProcessor:
         }
         
         try:
-            # Get voice notes for reference repair
-            voice_notes = self._extract_voice_notes(voice_score)
+            # Get voice notes for reference repair, unless the caller already extracted them
+            if voice_notes is None:
+                voice_notes = self._extract_voice_notes(voice_score)
             
             # Map voice names to music21 voice IDs based on our voice identification
             voice_id_mapping = self._get_voice_id_mapping_for_voice(voice_name)
@@ -548,10 +551,9 @@ class SpannerProcessor:
         """Extract all notes from a voice score."""
         notes = []
         try:
+            # One recursive walk per part instead of flattening every measure
             for part in voice_score.parts:
-                for measure in part.getElementsByClass('Measure'):
-                    for note in measure.flatten().notes:
-                        notes.append(note)
+                notes.extend(part.recurse().notes)
         except Exception:
             pass
         return notes
@@ -590,10 +592,7 @@ class SpannerProcessor:
                 end_note = spanned_elements[-1]
                 
                 # Find equivalent notes in the part
-                part_notes = []
-                for measure in part.getElementsByClass('Measure'):
-                    for note in measure.flatten().notes:
-                        part_notes.append(note)
+                part_notes = list(part.recurse().notes)
                 
                 # Find matching start and end notes
                 start_match = self._find_matching_note_in_part(start_note, part_notes)
@@ -144,14 +144,22 @@ class StaffSimplifier:
     def _merge_measure_elements(self, base_measure: music21.stream.Measure,
                               source_measure: music21.stream.Measure):
         """Merge elements from source measure into base measure."""
-        # Add all elements from source measure to base measure
+        # Collect all elements from source measure first
+        elements_to_merge = []
         for element in source_measure:
             # Skip if it's a voice container (we want the flattened content)
             if isinstance(element, music21.stream.Voice):
                 for voice_element in element:
-                    base_measure.insert(voice_element.offset, voice_element)
+                    elements_to_merge.append((voice_element.offset, voice_element))
             else:
-                base_measure.insert(element.offset, element)
+                elements_to_merge.append((element.offset, element))
+        
+        # Add them to base measure with music21's core insert, signalling the change once
+        for offset, element in elements_to_merge:
+            base_measure.coreGuardBeforeAddElement(element)
+            base_measure.coreInsert(offset, element)
+        if elements_to_merge:
+            base_measure.coreElementsChanged()
     
     def set_appropriate_clef(self, part: music21.stream.Part, voice_type: str):
         """Set clef appropriate for voice type."""
@@ -203,7 +203,25 @@ def save_voice_scores(voice_scores: Dict[str, music21.stream.Score],
         voice_score.metadata.title = f"{base_name} ({voice_name})"
         
         # Write to file
-        voice_score.write('musicxml', fp=str(filepath))
+        _write_musicxml(voice_score, str(filepath))
         created_files.append(str(filepath))
     
-    return created_files
\ No newline at end of file
+    return created_files
+
+
+def _write_musicxml(score: music21.stream.Score, filepath: str) -> None:
+    """
+    Export a score to MusicXML and write the bytes straight to disk.
+    
+    Calls music21's exporter directly rather than going through
+    Stream.write's format dispatch and temp-path handling.
+    
+    Args:
+        score: Score to export
+        filepath: Destination file path
+    """
+    from music21.musicxml.m21ToXml import GeneralObjectExporter
+    
+    xml_bytes = GeneralObjectExporter(score).parse()
+    with open(filepath, 'wb') as f:
+        f.write(xml_bytes)
\ No newline at end of file
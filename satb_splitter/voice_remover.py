@@ -88,6 +88,8 @@ class VoiceRemover:
         elements_removed = 0
         warnings = []
         
+        keep_voice_id_str = str(keep_voice_id)
+        
         for measure in part.getElementsByClass(music21.stream.Measure):
             # Preserve MusicXML layout elements before voice processing
             layout_elements = self._preserve_layout_elements(measure)
@@ -104,14 +106,11 @@ class VoiceRemover:
                 continue
             
             # Find the voice to keep (standardize on string voice IDs per music21 convention)
-            target_voice = None
-            keep_voice_id_str = str(keep_voice_id)
-            
-            # First try to find by voice ID
+            # First try to find by voice ID, keeping the first voice for each ID
+            voices_by_id = {}
             for voice in voices:
-                if str(voice.id) == keep_voice_id_str:
-                    target_voice = voice
-                    break
+                voices_by_id.setdefault(str(voice.id), voice)
+            target_voice = voices_by_id.get(keep_voice_id_str)
             
             # If not found and keep_voice_id is numeric, try index-based access as fallback
             if target_voice is None and keep_voice_id_str.isdigit():
@@ -176,12 +175,16 @@ class VoiceRemover:
             voice.activeSite = None
         measure.remove(voice)
         
-        # Add elements to measure using music21's insert method
+        # Add elements to measure with music21's core insert, then signal the
+        # change once rather than re-checking the measure after every element
         for offset, element in elements_to_move:
             # Clear the element's previous activeSite relationship
             if hasattr(element, 'activeSite'):
                 element.activeSite = None
-            measure.insert(offset, element)
+            measure.coreGuardBeforeAddElement(element)
+            measure.coreInsert(offset, element)
+        if elements_to_move:
+            measure.coreElementsChanged()
     
     def _remove_empty_parts(self, score: music21.stream.Score):
         """Remove parts that have no musical content."""
@@ -197,10 +200,9 @@ class VoiceRemover:
     def _is_part_empty(self, part: music21.stream.Part) -> bool:
         """Check if a part is empty of musical content."""
         # Check for notes, rests, or other musical elements
-        # Cache flattened view for performance
-        flattened_part = part.flatten()
-        notes = flattened_part.notes
-        return len(notes) == 0
+        # Walk the part in place and stop at the first note instead of
+        # building a flattened copy and counting every note in it
+        return part.recurse().notes.first() is None
     
     def _clean_empty_measures(self, score: music21.stream.Score):
         """Clean up measures that become empty after voice removal."""
@@ -3,12 +3,18 @@
 Debug script to analyze how crescendos are stored in the original score vs separated parts.
 """
 
+from functools import lru_cache
 from music21 import converter
 from pathlib import Path
 
+@lru_cache(maxsize=8)
+def _parse(path):
+    """Parse a score once per path; the analyses below only read from it."""
+    return converter.parse(path)
+
 def analyze_all_direction_elements(file_path):
     """Analyze what types of direction elements exist throughout the score."""
-    score = converter.parse(str(file_path))
+    score = _parse(str(file_path))
     
     print(f"=== Analyzing {file_path} ===")
     
@@ -53,7 +59,7 @@ def analyze_all_direction_elements(file_path):
 
 def analyze_measure_4_detailed(file_path):
     """Detailed analysis of measure 4 structure."""
-    score = converter.parse(str(file_path))
+    score = _parse(str(file_path))
     
     print(f"\n=== Detailed Measure 4 Analysis for {file_path} ===")
     
@@ -3,6 +3,7 @@
 Debug script to analyze spanner note references in detail.
 """
 
+import copy
 from music21 import converter
 from pathlib import Path
 from satb_splitter.main import split_satb_voices
@@ -59,7 +60,10 @@ def analyze_spanner_note_references():
     # Now process with voice separation and check if the notes still exist
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
-        voices = split_satb_voices(str(original_file), str(temp_path))
+        # Split a copy of the score parsed above; the splitter works on a parsed
+        # Score in place, and its output spanners would reference these notes
+        voices = split_satb_voices(copy.deepcopy(original_score), str(temp_path),
+                                   base_name=original_file.stem)
         
         soprano_score = voices.get('Soprano')
         if soprano_score and target_crescendo:
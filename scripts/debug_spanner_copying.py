@@ -3,6 +3,7 @@
 Debug script to test if spanners are being copied properly.
 """
 
+import copy
 from music21 import converter
 from pathlib import Path
 from satb_splitter.main import split_satb_voices
@@ -27,7 +28,10 @@ def test_spanner_copying():
     # Create temporary directory and split voices
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
-        voices = split_satb_voices(str(original_file), str(temp_path))
+        # Split a copy of the score parsed above; the splitter works on a parsed
+        # Score in place, and its output spanners would reference these notes
+        voices = split_satb_voices(copy.deepcopy(original_score), str(temp_path),
+                                   base_name=original_file.stem)
         
         print(f"Voices created: {list(voices.keys())}")
         
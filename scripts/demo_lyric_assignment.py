@@ -108,10 +108,10 @@ def compare_before_after():
     
     print("Original score structure:")
     for i, part in enumerate(original.parts):
-        print(f"  Part {i+1}: {len(list(part.getElementsByClass('Measure')))} measures")
+        print(f"  Part {i+1}: {len(part.getElementsByClass('Measure'))} measures")
         
         # Check first measure for lyrics
-        first_measure = list(part.getElementsByClass('Measure'))[0]
+        first_measure = part.getElementsByClass('Measure').first()
         lyrics_found = []
         for note in first_measure.getElementsByClass('Note'):
             if note.lyrics:
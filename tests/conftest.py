@@ -2,6 +2,7 @@
 
 import pytest
 import os
+from collections import Counter
 from pathlib import Path
 import tempfile
 import music21
@@ -12,6 +13,9 @@ from satb_splitter.utils import load_score
 import warnings
 import pytest
 
+# Voice names in high-to-low order, as produced by split_satb_voices
+EXPECTED_VOICES = ('Soprano', 'Alto', 'Tenor', 'Bass')
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_sessionfinish(session, exitstatus):
     # Note: session.warnings is not available in newer pytest versions
@@ -53,16 +57,25 @@ def score_processor():
     return ScoreProcessor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def voice_scores(sample_musicxml_file):
-    """Process the sample file and return voice scores."""
+    """Process the sample file once and return voice scores (treat as read-only)."""
     return split_satb_voices(sample_musicxml_file)
 
 
+@pytest.fixture(scope="session")
+def voice_score_stats(voice_scores):
+    """Per-voice aggregates gathered in a single traversal of each voice score."""
+    return {
+        voice_name: TestHelpers.collect_score_stats(score)
+        for voice_name, score in voice_scores.items()
+    }
+
+
 @pytest.fixture
 def expected_voices():
     """List of expected voice names."""
-    return ['Soprano', 'Alto', 'Tenor', 'Bass']
+    return list(EXPECTED_VOICES)
 
 
 class TestHelpers:
@@ -89,10 +102,10 @@ class TestHelpers:
         
         pitches = []
         for note in notes:
-            if hasattr(note, 'pitch'):
-                pitches.append(note.pitch.ps)
-            elif hasattr(note, 'pitches'):  # Chord
+            if note.isChord:
                 pitches.extend([p.ps for p in note.pitches])
+            else:
+                pitches.append(note.pitch.ps)
         
         if not pitches:
             return None
@@ -104,12 +117,83 @@ class TestHelpers:
             'count': len(pitches)
         }
     
+    @staticmethod
+    def pack_note_key(ps, offset, quarter_length):
+        """Pack a (pitch.ps, offset, quarterLength) triple into a single int.
+        
+        Pitches are kept to quarter-tones and times to 1/96 of a quarter note, which
+        represents triplet and 32nd-note positions exactly. Each time field gets 20 bits.
+        """
+        return (round(ps * 4) << 40) | (round(offset * 96) << 20) | round(quarter_length * 96)
+    
+    @staticmethod
+    def collect_score_stats(score):
+        """Gather note, measure, pitch, duration and chord aggregates in one pass per part.
+        
+        duration_histogram maps each quarterLength to how many notes and chords use it;
+        note_set holds one pack_note_key(pitch.ps, offset, quarterLength) per sounding pitch;
+        dynamics lists the value of each Dynamic placed directly in a measure;
+        measure_count follows count_measures_in_score and counts the first part only.
+        """
+        note_count = 0
+        chord_count = 0
+        pitches = []
+        duration_histogram = Counter()
+        note_set = set()
+        dynamics = []
+        
+        # Resolve the classes once rather than per element in the loop below
+        measure_class = music21.stream.Measure
+        note_class = music21.note.Note
+        chord_class = music21.chord.Chord
+        dynamic_class = music21.dynamics.Dynamic
+        pack_note_key = TestHelpers.pack_note_key
+        
+        for part in score.parts:
+            for element in part.recurse():
+                if isinstance(element, note_class):
+                    note_count += 1
+                    pitches.append(element.pitch.ps)
+                    duration_histogram[element.duration.quarterLength] += 1
+                    note_set.add(pack_note_key(
+                        element.pitch.ps, element.offset, element.duration.quarterLength))
+                elif isinstance(element, chord_class):
+                    note_count += 1
+                    chord_count += 1
+                    chord_pitches = [p.ps for p in element.pitches]
+                    pitches.extend(chord_pitches)
+                    duration_histogram[element.duration.quarterLength] += 1
+                    note_set.update(
+                        pack_note_key(ps, element.offset, element.duration.quarterLength)
+                        for ps in chord_pitches)
+                elif isinstance(element, dynamic_class) and isinstance(element.activeSite, measure_class):
+                    dynamics.append(element.value)
+        
+        pitch_range = None
+        if pitches:
+            pitch_range = {
+                'min': min(pitches),
+                'max': max(pitches),
+                'avg': sum(pitches) / len(pitches),
+                'count': len(pitches)
+            }
+        
+        return {
+            'note_count': note_count,
+            'measure_count': TestHelpers.count_measures_in_score(score),
+            'pitch_range': pitch_range,
+            'duration_histogram': dict(duration_histogram),
+            'chord_count': chord_count,
+            'note_set': frozenset(note_set),
+            'dynamics': dynamics
+        }
+    
     @staticmethod
     def get_lyrics_from_measure(score, measure_number):
         """Extract lyrics from a specific measure."""
         lyrics = []
         for part in score.parts:
-            measures = list(part.getElementsByClass('Measure'))
+            measures = part.getElementsByClass(music21.stream.Measure)
             if len(measures) >= measure_number:
                 measure = measures[measure_number - 1]
                 
@@ -127,7 +211,7 @@ class TestHelpers:
         dynamics_found = []
         
         for part in score.parts:
-            measures = list(part.getElementsByClass(music21.stream.Measure))
+            measures = part.getElementsByClass(music21.stream.Measure)
             if len(measures) >= measure_number:
                 measure = measures[measure_number - 1]
                 for element in measure:
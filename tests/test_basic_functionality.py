@@ -1,6 +1,7 @@
 """Basic functionality tests for the SATB splitter."""
 
 import pytest
+import copy
 import music21
 from pathlib import Path
 from satb_splitter import split_satb_voices
@@ -43,10 +44,60 @@ class TestBasicFunctionality:
             assert expected_file.exists(), f"Output file not created for {voice}"
             
             # Verify file is valid MusicXML
-            score = music21.converter.parse(str(expected_file))
+            score = music21.converter.parse(str(expected_file), forceSource=True)
             assert score is not None
             assert len(score.parts) > 0
 
+    def test_split_satb_voices_accepts_parsed_score(self, sample_score, expected_voices):
+        """Test voice splitting from an already-parsed score."""
+        voice_scores = split_satb_voices(copy.deepcopy(sample_score))
+        
+        assert len(voice_scores) == len(expected_voices)
+        for voice in expected_voices:
+            assert voice in voice_scores, f"Missing voice: {voice}"
+            assert len(voice_scores[voice].flatten().notes) > 0, f"{voice} has no notes"
+
+    def test_split_satb_voices_parsed_score_title_with_separator(self, sample_score, temp_output_dir,
+                                                                 expected_voices):
+        """Test that a parsed score's title is made safe for use as a filename."""
+        score = copy.deepcopy(sample_score)
+        score.metadata.title = "Ave Maria / Bach"
+        
+        split_satb_voices(score, output_dir=str(temp_output_dir))
+        
+        for voice in expected_voices:
+            expected_file = temp_output_dir / f"Ave Maria - Bach-{voice}.musicxml"
+            assert expected_file.exists(), f"Output file not created for {voice}"
+
+    def test_split_satb_voices_explicit_base_name(self, sample_score, temp_output_dir, expected_voices):
+        """Test that an explicit base_name overrides the parsed score's title."""
+        split_satb_voices(copy.deepcopy(sample_score), output_dir=str(temp_output_dir),
+                          base_name="custom")
+        
+        for voice in expected_voices:
+            expected_file = temp_output_dir / f"custom-{voice}.musicxml"
+            assert expected_file.exists(), f"Output file not created for {voice}"
+
+    def test_split_satb_voices_preserves_rest_notation(self, sample_score):
+        """Test that rests in the kept voice keep their fermata, position and id."""
+        score = copy.deepcopy(sample_score)
+        
+        # Soprano is voice 1 of the first part; mark its rest in measure 4
+        measure = score.parts[0].measure(4)
+        rest = measure.voices[0].getElementsByClass(music21.note.Rest).first()
+        rest.expressions.append(music21.expressions.Fermata())
+        rest.stepShift = 3
+        rest.id = 'myrest'
+        
+        voice_scores = split_satb_voices(score)
+        
+        soprano_measure = voice_scores['Soprano'].parts[0].measure(4)
+        soprano_rest = soprano_measure.recurse().getElementsByClass(music21.note.Rest).first()
+        assert soprano_rest is not None, "Soprano rest in measure 4 was lost"
+        assert [type(e) for e in soprano_rest.expressions] == [music21.expressions.Fermata]
+        assert soprano_rest.stepShift == 3
+        assert soprano_rest.id == 'myrest'
+
     def test_split_satb_voices_nonexistent_file(self):
         """Test error handling for nonexistent file."""
         with pytest.raises((FileNotFoundError, SATBSplitError)):
@@ -60,14 +111,14 @@ class TestBasicFunctionality:
         with pytest.raises((SATBSplitError, Exception)):
             split_satb_voices(str(invalid_file))
 
-    def test_voice_scores_structure(self, voice_scores, helpers):
+    def test_voice_scores_structure(self, voice_scores, voice_score_stats):
         """Test the structure of returned voice scores."""
         for voice_name, score in voice_scores.items():
             # Each voice should have exactly one part
             assert len(score.parts) == 1, f"{voice_name} should have exactly one part"
             
             # Check measure count consistency
-            measure_count = helpers.count_measures_in_score(score)
+            measure_count = voice_score_stats[voice_name]['measure_count']
             assert measure_count > 0, f"{voice_name} should have measures"
             
             # Check that the part has proper structure
@@ -111,14 +162,14 @@ class TestVoiceIdentification:
         assert voice_mapping.tenor is not None, "Tenor not mapped"
         assert voice_mapping.bass is not None, "Bass not mapped"
 
-    def test_voice_pitch_ranges(self, voice_scores, helpers):
+    def test_voice_pitch_ranges(self, voice_score_stats):
         """Test that voices have appropriate pitch ranges."""
         # Get pitch ranges for each voice
-        voice_ranges = {}
-        for voice_name, score in voice_scores.items():
-            pitch_range = helpers.get_pitch_range(score)
-            if pitch_range:
-                voice_ranges[voice_name] = pitch_range
+        voice_ranges = {
+            voice_name: stats['pitch_range']
+            for voice_name, stats in voice_score_stats.items()
+            if stats['pitch_range']
+        }
 
         # Should have all four voices with pitch data
         assert len(voice_ranges) == 4, "Should have pitch data for all four voices"
@@ -202,17 +253,16 @@ class TestIntegration:
             assert output_file.exists(), f"Output file missing for {voice}"
             
             # Verify file can be loaded and has content
-            score = music21.converter.parse(str(output_file))
+            score = music21.converter.parse(str(output_file), forceSource=True)
             assert len(score.parts) > 0, f"{voice} output file has no parts"
-            assert len(score.flatten().notes) > 0, f"{voice} output file has no notes"
+            assert score[music21.note.Note].first() is not None, f"{voice} output file has no notes"
 
-    def test_voice_consistency(self, voice_scores, helpers):
+    def test_voice_consistency(self, voice_score_stats):
         """Test that all voices have consistent structure."""
-        measure_counts = {}
-        
-        for voice_name, score in voice_scores.items():
-            measure_count = helpers.count_measures_in_score(score)
-            measure_counts[voice_name] = measure_count
+        measure_counts = {
+            voice_name: stats['measure_count']
+            for voice_name, stats in voice_score_stats.items()
+        }
         
         # All voices should have the same number of measures
         unique_counts = set(measure_counts.values())
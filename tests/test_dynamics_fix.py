@@ -29,19 +29,12 @@ class TestDynamicsFix:
             assert 'dynamic' in dynamic, "Dynamic should have a value"
             assert 'offset' in dynamic, "Dynamic should have an offset"
 
-    def test_dynamics_preservation_across_voices(self, voice_scores, helpers):
+    def test_dynamics_preservation_across_voices(self, voice_score_stats):
         """Test that dynamics are properly preserved across all voices."""
-        dynamics_per_voice = {}
-        
-        for voice_name, score in voice_scores.items():
-            total_dynamics = 0
-            for part in score.parts:
-                for measure in part.getElementsByClass(music21.stream.Measure):
-                    for element in measure:
-                        if isinstance(element, music21.dynamics.Dynamic):
-                            total_dynamics += 1
-            
-            dynamics_per_voice[voice_name] = total_dynamics
+        dynamics_per_voice = {
+            voice_name: len(stats['dynamics'])
+            for voice_name, stats in voice_score_stats.items()
+        }
 
         # Each voice should have some dynamics, but not excessive amounts
         for voice_name, count in dynamics_per_voice.items():
@@ -117,7 +110,7 @@ class TestDynamicsFix:
             assert output_file.exists(), f"Output file missing for {voice}"
             
             # Load and verify the file
-            reloaded_score = music21.converter.parse(str(output_file))
+            reloaded_score = music21.converter.parse(str(output_file), forceSource=True)
             assert reloaded_score is not None, f"Could not reload {voice} file"
             
             # Count dynamics in the reloaded file
@@ -169,17 +162,14 @@ class TestDynamicsPreservation:
             notes = score.flatten().notes
             assert len(notes) > 0, f"{voice_name} should have musical content"
 
-    def test_dynamics_types(self, voice_scores):
+    def test_dynamics_types(self, voice_score_stats):
         """Test that various types of dynamics are handled correctly."""
-        dynamics_types_found = set()
-        
-        for voice_name, score in voice_scores.items():
-            for part in score.parts:
-                for measure in part.getElementsByClass(music21.stream.Measure):
-                    for element in measure:
-                        if isinstance(element, music21.dynamics.Dynamic):
-                            if hasattr(element, 'value') and element.value:
-                                dynamics_types_found.add(element.value)
+        dynamics_types_found = {
+            value
+            for stats in voice_score_stats.values()
+            for value in stats['dynamics']
+            if value
+        }
         
         # If dynamics are found, they should be valid types
         valid_dynamics = {'p', 'mp', 'mf', 'f', 'ff', 'pp', 'ppp', 'fff', 'sf', 'sfz'}
@@ -167,7 +167,7 @@ class TestLyricAssignment:
             has_lyrics = False
             
             for part in score.parts:
-                measures = list(part.getElementsByClass('Measure'))
+                measures = part.getElementsByClass('Measure')
                 if len(measures) >= measure_number:
                     measure = measures[measure_number - 1]
                     
@@ -190,7 +190,7 @@ class TestLyricAssignment:
         
         lyrics = []
         for part in score.parts:
-            measures = list(part.getElementsByClass('Measure'))
+            measures = part.getElementsByClass('Measure')
             if len(measures) >= measure:
                 target_measure = measures[measure - 1]
                 
@@ -210,7 +210,7 @@ class TestLyricAssignment:
             return False
         
         for part in score.parts:
-            part_measures = list(part.getElementsByClass('Measure'))
+            part_measures = part.getElementsByClass('Measure')
             
             for measure_num in measures:
                 if len(part_measures) >= measure_num:
@@ -229,7 +229,7 @@ class TestLyricAssignment:
         
         lyrics = []
         for part in score.parts:
-            measures = list(part.getElementsByClass('Measure'))
+            measures = part.getElementsByClass('Measure')
             if len(measures) >= measure_number:
                 measure = measures[measure_number - 1]
                 
@@ -289,7 +289,7 @@ class TestLyricAssignmentComprehensive:
         
         lyrics = []
         for part in score.parts:
-            measures = list(part.getElementsByClass('Measure'))
+            measures = part.getElementsByClass('Measure')
             if len(measures) >= measure:
                 target_measure = measures[measure - 1]
                 
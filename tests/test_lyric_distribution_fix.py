@@ -61,12 +61,10 @@ class TestLyricDistributionFix:
                     print(f"\n{voice_name} measure 29 lyrics: {measure_29_lyrics}")
             
             # Validate that "far" appears in multiple voices (the fix)
-            voices_with_far = []
-            for voice_name, lyrics in lyric_results.items():
-                for lyric_info in lyrics:
-                    if 'far' in lyric_info['text'].lower():
-                        voices_with_far.append(voice_name)
-                        break
+            voices_with_far = [
+                voice_name for voice_name, lyrics in lyric_results.items()
+                if any('far' in lyric_info['text'].lower() for lyric_info in lyrics)
+            ]
             
             print(f"\nVoices with 'far' lyric: {voices_with_far}")
             
@@ -128,19 +126,21 @@ class TestLyricDistributionFix:
             for voice_name, voice_score in voices.items():
                 for part in voice_score.parts:
                     for measure in part.getElementsByClass('Measure'):
-                        # Check if measure has both slurs and lyrics
-                        has_slurs = len(measure.getElementsByClass('Slur')) > 0
-                        
+                        # Collect slurs and lyric-bearing notes in a single pass
+                        slur_count = 0
                         notes_with_lyrics = []
-                        for note in measure.getElementsByClass('Note'):
-                            if hasattr(note, 'lyrics') and note.lyrics:
-                                notes_with_lyrics.append(note)
-                        
-                        if has_slurs and notes_with_lyrics:
+                        for element in measure:
+                            classes = element.classes
+                            if 'Slur' in classes:
+                                slur_count += 1
+                            elif 'Note' in classes and element.lyrics:
+                                notes_with_lyrics.append(element)
+
+                        if slur_count and notes_with_lyrics:
                             slur_lyric_interactions.append({
                                 'voice': voice_name,
                                 'measure': measure.number if hasattr(measure, 'number') else 'unknown',
-                                'slur_count': len(measure.getElementsByClass('Slur')),
+                                'slur_count': slur_count,
                                 'lyric_notes': len(notes_with_lyrics)
                             })
             
@@ -196,16 +196,15 @@ class TestLyricDistributionEdgeCases:
                     assert lyrics1 == lyrics2, f"Lyric distribution should be deterministic for {voice_name}"
     
     def _extract_measure_lyrics(self, voice_score, measure_number):
-        """Extract lyrics from a specific measure for comparison."""
+        """Extract (text, offset) pairs from a specific measure for comparison."""
         lyrics = []
         for part in voice_score.parts:
             for measure in part.getElementsByClass('Measure'):
                 if hasattr(measure, 'number') and measure.number == measure_number:
                     for note in measure.flatten().notes:
                         if hasattr(note, 'lyrics') and note.lyrics:
+                            offset = float(note.offset)
                             for lyric in note.lyrics:
-                                lyrics.append({
-                                    'text': lyric.text if hasattr(lyric, 'text') else str(lyric),
-                                    'offset': note.offset
-                                })
-        return sorted(lyrics, key=lambda x: x['offset'])
\ No newline at end of file
+                                text = lyric.text if hasattr(lyric, 'text') else str(lyric)
+                                lyrics.append((text, offset))
+        return tuple(sorted(lyrics, key=lambda x: x[1]))
\ No newline at end of file
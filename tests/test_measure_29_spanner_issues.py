@@ -82,27 +82,27 @@ class TestMeasure29Issues:
             # REGRESSION TEST: Verify specific requirements are met
             print(f"\n✅ TESTING SPECIFIC REQUIREMENTS:")
             
-            soprano_count = spanner_preservation_results.get('Soprano', {}).get('count', 0)
-            alto_count = spanner_preservation_results.get('Alto', {}).get('count', 0)
-            tenor_count = spanner_preservation_results.get('Tenor', {}).get('count', 0)
-            bass_count = spanner_preservation_results.get('Bass', {}).get('count', 0)
+            counts = {
+                voice: spanner_preservation_results.get(voice, {}).get('count', 0)
+                for voice in ('Soprano', 'Alto', 'Tenor', 'Bass')
+            }
             
             # Test 1: No nuclear copying (Soprano and Alto should not have identical high counts)
-            assert not (soprano_count == alto_count and soprano_count > 10), \
-                f"Nuclear copying detected: Soprano and Alto both have {soprano_count} spanners"
+            nuclear_copying = counts['Soprano'] == counts['Alto'] > 10
+            assert not nuclear_copying, \
+                f"Nuclear copying detected: Soprano and Alto both have {counts['Soprano']} spanners"
             print(f"   ✅ No nuclear copying detected")
             
             # Test 2: Alto, Tenor, and Bass should have slurs (non-zero spanners)
-            assert alto_count > 0, f"Alto should have slurs but has {alto_count} spanners"
-            assert tenor_count > 0, f"Tenor should have slurs but has {tenor_count} spanners"
-            assert bass_count > 0, f"Bass should have slurs but has {bass_count} spanners"
-            print(f"   ✅ All voices have spanners: Alto={alto_count}, Tenor={tenor_count}, Bass={bass_count}")
+            for voice in ('Alto', 'Tenor', 'Bass'):
+                assert counts[voice] > 0, f"{voice} should have slurs but has {counts[voice]} spanners"
+            print(f"   ✅ All voices have spanners: Alto={counts['Alto']}, Tenor={counts['Tenor']}, Bass={counts['Bass']}")
             
             # Test 3: Check for specific slurs in measure 29
             self._verify_measure_29_slurs(voices)
             
             # Test 4: Reasonable preservation rate (should be close to 100%, not >100%)
-            total_preserved = soprano_count + alto_count + tenor_count + bass_count
+            total_preserved = sum(counts.values())
             # Use a reasonable baseline for total expected spanners
             baseline_expected = 17  # We know from debugging that there are 17 spanners in the full score
             
@@ -241,10 +241,10 @@ class TestMeasure29Issues:
         
         pitches = []
         for note in notes:
-            if hasattr(note, 'pitch'):
-                pitches.append(note.pitch.midi)
-            elif hasattr(note, 'pitches'):  # Chord
+            if note.isChord:
                 pitches.extend(p.midi for p in note.pitches)
+            else:
+                pitches.append(note.pitch.midi)
         
         if pitches:
             return {'min': min(pitches), 'max': max(pitches), 'range': max(pitches) - min(pitches)}
@@ -320,12 +320,17 @@ class TestCrossVoiceSpanners:
             spanners = part.getElementsByClass('Spanner')
             print(f"\nPart {part_idx}: {len(spanners)} spanners")
             
+            # Resolve spanned elements once per spanner
+            spanned_elements_map = {
+                id(spanner): spanner.getSpannedElements() for spanner in spanners
+            }
+            
             for spanner in spanners:
                 spanner_info = {
                     'part': part_idx,
                     'type': type(spanner).__name__,
                     'repr': str(spanner),
-                    'is_cross_voice': self._is_cross_voice_spanner(spanner)
+                    'is_cross_voice': self._is_cross_voice_spanner(spanned_elements_map[id(spanner)])
                 }
                 
                 if spanner_info['is_cross_voice']:
@@ -339,22 +344,21 @@ class TestCrossVoiceSpanners:
         # This test documents the current state - later we'll add proper handling
         assert len(cross_voice_spanners) >= 0, "Should be able to identify cross-voice spanners"
     
-    def _is_cross_voice_spanner(self, spanner):
-        """Determine if a spanner crosses voice boundaries."""
+    def _is_cross_voice_spanner(self, spanned_elements):
+        """Determine if a spanner's elements cross voice boundaries."""
         try:
-            if hasattr(spanner, 'getSpannedElements'):
-                spanned_elements = spanner.getSpannedElements()
-                
-                if len(spanned_elements) >= 2:
-                    # Check if elements are in different voices/parts
-                    first_element = spanned_elements[0]
-                    last_element = spanned_elements[-1]
-                    
-                    # Simple heuristic: different pitch ranges suggest different voices
-                    if (hasattr(first_element, 'pitch') and hasattr(last_element, 'pitch')):
-                        pitch_diff = abs(first_element.pitch.midi - last_element.pitch.midi)
-                        # Large pitch jumps might indicate cross-voice spanners
-                        return pitch_diff > 12  # More than an octave
+            if len(spanned_elements) < 2:
+                return False
+            
+            # Check if elements are in different voices/parts
+            first_element = spanned_elements[0]
+            last_element = spanned_elements[-1]
+            
+            # Simple heuristic: different pitch ranges suggest different voices
+            if (hasattr(first_element, 'pitch') and hasattr(last_element, 'pitch')):
+                pitch_diff = abs(first_element.pitch.midi - last_element.pitch.midi)
+                # Large pitch jumps might indicate cross-voice spanners
+                return pitch_diff > 12  # More than an octave
             
             return False
         except Exception:
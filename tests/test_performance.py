@@ -1,39 +1,59 @@
 """Performance and stress tests for the SATB splitter."""
 
 import pytest
+import copy
+import os
 import time
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import music21
+from music21 import stream
+from music21.musicxml.m21ToXml import GeneralObjectExporter
 from satb_splitter import split_satb_voices
 from satb_splitter.score_processor import ScoreProcessor
+from satb_splitter.utils import save_voice_scores
+from .conftest import EXPECTED_VOICES
+
+OUTPUT_FILENAMES = tuple(f"Crossing The Bar-{voice}.musicxml" for voice in EXPECTED_VOICES)
+
+
+def _process_in_fresh_processor(input_file):
+    """Run a fresh ScoreProcessor in a worker process and return the voice count."""
+    result = ScoreProcessor().process_satb_score(input_file)
+    return len(result.voice_scores)
+
+
+@pytest.fixture(scope="module")
+def cached_split(sample_musicxml_file):
+    """Split the sample file once per module and record its wall and CPU time."""
+    cpu_start = time.process_time()
+    start_ns = time.perf_counter_ns()
+    voice_scores = split_satb_voices(sample_musicxml_file)
+    wall_ns = time.perf_counter_ns() - start_ns
+    return voice_scores, wall_ns, time.process_time() - cpu_start
 
 
 class TestPerformance:
     """Test performance characteristics of the SATB splitter."""
 
     @pytest.mark.slow
-    def test_processing_time_reasonable(self, sample_musicxml_file):
+    def test_processing_time_reasonable(self, cached_split):
         """Test that processing time is reasonable for typical files."""
-        start_time = time.time()
-        
-        voice_scores = split_satb_voices(sample_musicxml_file)
-        
-        end_time = time.time()
-        processing_time = end_time - start_time
+        voice_scores, wall_ns, cpu_elapsed = cached_split
         
-        # Should complete within reasonable time (adjust as needed)
-        assert processing_time < 30.0, f"Processing took too long: {processing_time:.2f}s"
+        # Threshold applies to CPU time so a busy or swapping host doesn't fail the test
+        assert cpu_elapsed < 30.0, \
+            f"Processing took too long: {cpu_elapsed:.2f}s CPU ({wall_ns / 1e9:.2f}s wall)"
         assert len(voice_scores) > 0, "Should produce voice scores"
 
     @pytest.mark.slow
-    def test_memory_usage_stability(self, sample_musicxml_file):
+    def test_memory_usage_stability(self, sample_score):
         """Test that memory usage remains stable across multiple runs."""
-        # Process the file multiple times to check for memory leaks
+        # Process the score multiple times to check for memory leaks
         results = []
         
         for i in range(5):
-            voice_scores = split_satb_voices(sample_musicxml_file)
+            voice_scores = split_satb_voices(copy.deepcopy(sample_score))
             results.append(len(voice_scores))
             
             # Verify consistent results
@@ -44,35 +64,35 @@ class TestPerformance:
 
     def test_concurrent_processing_safety(self, sample_musicxml_file):
         """Test that concurrent processing doesn't cause issues."""
-        processors = [ScoreProcessor() for _ in range(3)]
-        results = []
-        
-        # Process with multiple processors
-        for processor in processors:
-            result = processor.process_satb_score(sample_musicxml_file)
-            results.append(len(result.voice_scores))
+        # Process with multiple processors running in parallel
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(_process_in_fresh_processor, [sample_musicxml_file] * 3))
         
         # All should produce similar results
         assert len(set(results)) <= 1, f"Inconsistent concurrent results: {results}"
 
     @pytest.mark.slow
-    def test_large_output_handling(self, sample_musicxml_file, temp_output_dir):
+    def test_large_output_handling(self, cached_split, temp_output_dir):
         """Test handling of scenarios that might produce large outputs."""
-        # Process with output enabled
-        voice_scores = split_satb_voices(
-            sample_musicxml_file,
-            output_dir=str(temp_output_dir)
-        )
+        # Save a copy of the already-split voices rather than splitting again;
+        # save_voice_scores rewrites their metadata, and the fixture is shared
+        voice_scores, _, _ = cached_split
+        save_voice_scores(copy.deepcopy(voice_scores), str(temp_output_dir), "Crossing The Bar")
         
         # Check that all files were created and are reasonable size
-        expected_voices = ['Soprano', 'Alto', 'Tenor', 'Bass']
+        with os.scandir(temp_output_dir) as entries:
+            sizes = {
+                entry.name: entry.stat().st_size
+                for entry in entries if entry.name.endswith('.musicxml')
+            }
         
-        for voice in expected_voices:
-            output_file = temp_output_dir / f"Crossing The Bar-{voice}.musicxml"
-            assert output_file.exists(), f"Output file missing for {voice}"
-            
+        expected_files = dict(zip(OUTPUT_FILENAMES, EXPECTED_VOICES))
+        missing = expected_files.keys() - sizes.keys()
+        assert not missing, f"Output files missing for {sorted(expected_files[f] for f in missing)}"
+        
+        for filename, voice in expected_files.items():
             # Check file size is reasonable (not empty, not extremely large)
-            file_size = output_file.stat().st_size
+            file_size = sizes[filename]
             assert file_size > 100, f"{voice} file too small: {file_size} bytes"
             assert file_size < 10_000_000, f"{voice} file too large: {file_size} bytes"
 
@@ -81,33 +101,32 @@ class TestPerformance:
         processor = ScoreProcessor()
         
         # Time multiple aspects of processing
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = processor.process_satb_score(sample_musicxml_file)
-        end_time = time.time()
-        
-        total_time = end_time - start_time
+        total_ns = time.perf_counter_ns() - start_ns
         
         # Calculate efficiency metrics
         total_notes = sum(
-            len(score.flatten().notes) 
+            1
             for score in result.voice_scores.values()
+            for _ in score.recurse().notes
         )
         
         if total_notes > 0:
-            notes_per_second = total_notes / total_time
             # Should process at least a few notes per second
-            assert notes_per_second > 1.0, f"Too slow: {notes_per_second:.2f} notes/sec"
+            assert total_notes * 1_000_000_000 > total_ns, \
+                f"Too slow: {total_notes * 1e9 / total_ns:.2f} notes/sec"
 
 
 class TestStress:
     """Stress tests for edge cases and limits."""
 
-    def test_repeated_processing_stability(self, sample_musicxml_file):
+    def test_repeated_processing_stability(self, sample_score):
         """Test stability under repeated processing."""
-        # Process the same file many times
+        # Process the same score many times
         for i in range(10):
             try:
-                voice_scores = split_satb_voices(sample_musicxml_file)
+                voice_scores = split_satb_voices(copy.deepcopy(sample_score))
                 assert len(voice_scores) > 0, f"Failed on iteration {i}"
             except Exception as e:
                 pytest.fail(f"Failed on iteration {i}: {e}")
@@ -130,10 +149,12 @@ class TestStress:
     @pytest.mark.slow
     def test_output_directory_stress(self, sample_musicxml_file, tmp_path):
         """Test creating output in many different directories."""
-        # Create multiple output directories and process to each
-        for i in range(5):
-            output_dir = tmp_path / f"output_{i}"
-            
+        # Create multiple output directories up front, then process to each
+        output_dirs = [tmp_path / f"output_{i}" for i in range(5)]
+        for output_dir in output_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        
+        for i, output_dir in enumerate(output_dirs):
             voice_scores = split_satb_voices(
                 sample_musicxml_file,
                 output_dir=str(output_dir)
@@ -142,63 +163,56 @@ class TestStress:
             assert len(voice_scores) > 0, f"Failed for output directory {i}"
             
             # Verify files exist
-            expected_voices = ['Soprano', 'Alto', 'Tenor', 'Bass']
-            for voice in expected_voices:
-                output_file = output_dir / f"Crossing The Bar-{voice}.musicxml"
+            for voice, filename in zip(EXPECTED_VOICES, OUTPUT_FILENAMES):
+                output_file = output_dir / filename
                 assert output_file.exists(), f"Missing file in directory {i}: {voice}"
 
-    def test_score_object_reuse(self, sample_musicxml_file):
+    def test_score_object_reuse(self, sample_score, score_processor):
         """Test that score objects can be safely reused."""
-        # Use multiple processors with the same file
-        processors = [ScoreProcessor() for _ in range(3)]
-        
-        for i, processor in enumerate(processors):
-            # Test that multiple processors can handle the same file
-            result = processor.process_satb_score(sample_musicxml_file)
+        # ScoreProcessor keeps no per-run state, so one instance serves every run
+        for i in range(3):
+            result = score_processor.process_satb_score(copy.deepcopy(sample_score))
             
-            assert result is not None, f"Failed with processor {i}"
-            assert result.success, f"Processing failed with processor {i}"
-            assert len(result.voice_scores) > 0, f"No voice scores with processor {i}"
+            assert result is not None, f"Failed on run {i}"
+            assert result.success, f"Processing failed on run {i}"
+            assert len(result.voice_scores) > 0, f"No voice scores on run {i}"
 
 
 class TestResourceManagement:
     """Test proper resource management and cleanup."""
 
-    def test_temporary_resource_cleanup(self, sample_musicxml_file):
+    def test_temporary_resource_cleanup(self, sample_score):
         """Test that temporary resources are properly cleaned up."""
         # Process multiple times and ensure no resource leaks
-        initial_temp_count = len(list(Path(tempfile.gettempdir()).glob("*")))
+        temp_dir = tempfile.gettempdir()
+        with os.scandir(temp_dir) as entries:
+            initial_entries = {entry.name for entry in entries}
         
         for _ in range(5):
-            voice_scores = split_satb_voices(sample_musicxml_file)
+            voice_scores = split_satb_voices(copy.deepcopy(sample_score))
             assert len(voice_scores) > 0
         
-        final_temp_count = len(list(Path(tempfile.gettempdir()).glob("*")))
-        
         # Allow some variation but no major leaks
-        temp_increase = final_temp_count - initial_temp_count
+        with os.scandir(temp_dir) as entries:
+            temp_increase = sum(1 for entry in entries if entry.name not in initial_entries)
         assert temp_increase < 50, f"Possible temp file leak: {temp_increase} new files"
 
-    def test_music21_object_handling(self, sample_musicxml_file):
+    def test_music21_object_handling(self, sample_score):
         """Test proper handling of music21 objects."""
-        voice_scores = split_satb_voices(sample_musicxml_file)
+        voice_scores = split_satb_voices(copy.deepcopy(sample_score))
         
         # Verify all returned objects are valid music21 streams
         for voice_name, score in voice_scores.items():
-            assert isinstance(score, music21.stream.Stream), f"{voice_name} is not a Stream"
+            assert isinstance(score, stream.Stream), f"{voice_name} is not a Stream"
             
             # Test that objects can be used for typical operations
-            notes = score.flatten().notes
+            notes = score.recurse().notes
             assert hasattr(notes, '__len__'), f"{voice_name} notes not iterable"
-            
-            # Test serialization works
-            try:
-                xml_str = score.write('musicxml')
-                assert xml_str is not None, f"{voice_name} serialization failed"
-            except Exception as e:
-                # Some serialization issues might be acceptable
-                if "cannot" not in str(e).lower():
-                    raise
+        
+        # Test serialization works (in memory, without touching the filesystem)
+        for voice_name, score in voice_scores.items():
+            xml_bytes = GeneralObjectExporter(score).parse()
+            assert xml_bytes.startswith(b'<?xml'), f"{voice_name} serialization failed"
 
     def test_file_handle_management(self, sample_musicxml_file, temp_output_dir):
         """Test that file handles are properly managed."""
@@ -215,40 +229,48 @@ class TestResourceManagement:
             run_dir = temp_output_dir / f"run_{i}"
             assert run_dir.exists(), f"Output directory {i} missing"
             
-            musicxml_files = list(run_dir.glob("*.musicxml"))
+            musicxml_files = [
+                run_dir / filename
+                for filename in OUTPUT_FILENAMES
+                if (run_dir / filename).exists()
+            ]
             assert len(musicxml_files) > 0, f"No output files in directory {i}"
 
 
 class TestScalability:
     """Test scalability characteristics."""
 
-    def test_processing_scales_reasonably(self, sample_musicxml_file, tmp_path):
+    def test_processing_scales_reasonably(self, sample_score, tmp_path):
         """Test that processing time scales reasonably with complexity."""
-        # Process the same file with different configurations
+        # Process the same score with different configurations
         # More complex operations should not cause exponential time increases
+        # Each run gets its own copy of the parsed score, so XML parsing is not timed
         
         times = {}
         
         # Basic processing
-        start = time.time()
-        split_satb_voices(sample_musicxml_file)
-        times['basic'] = time.time() - start
+        score = copy.deepcopy(sample_score)
+        start = time.perf_counter_ns()
+        split_satb_voices(score)
+        times['basic'] = time.perf_counter_ns() - start
         
         # With output directory (more I/O)
-        start = time.time()
-        split_satb_voices(sample_musicxml_file, output_dir=str(tmp_path / "test1"))
-        times['with_output'] = time.time() - start
+        score = copy.deepcopy(sample_score)
+        start = time.perf_counter_ns()
+        split_satb_voices(score, output_dir=str(tmp_path / "test1"))
+        times['with_output'] = time.perf_counter_ns() - start
         
         # Multiple runs to test consistency
-        start = time.time()
-        for _ in range(2):
-            split_satb_voices(sample_musicxml_file)
-        times['multiple'] = (time.time() - start) / 2  # Average per run
+        scores = [copy.deepcopy(sample_score) for _ in range(2)]
+        start = time.perf_counter_ns()
+        for score in scores:
+            split_satb_voices(score)
+        times['multiple'] = (time.perf_counter_ns() - start) // 2  # Average per run
         
         # No processing should take more than 10x the basic processing time
         for feature, processing_time in times.items():
             assert processing_time < times['basic'] * 10, \
-                f"{feature} processing too slow: {processing_time:.2f}s vs basic {times['basic']:.2f}s"
+                f"{feature} processing too slow: {processing_time / 1e9:.2f}s vs basic {times['basic'] / 1e9:.2f}s"
 
     def test_output_size_reasonable(self, sample_musicxml_file, temp_output_dir):
         """Test that output file sizes are reasonable."""
@@ -262,12 +284,15 @@ class TestScalability:
         
         # Check output file sizes
         total_output_size = 0
-        expected_voices = ['Soprano', 'Alto', 'Tenor', 'Bass']
+        with os.scandir(temp_output_dir) as entries:
+            sizes = {
+                entry.name: entry.stat().st_size
+                for entry in entries if entry.name.endswith('.musicxml')
+            }
         
-        for voice in expected_voices:
-            output_file = temp_output_dir / f"Crossing The Bar-{voice}.musicxml"
-            if output_file.exists():
-                file_size = output_file.stat().st_size
+        for voice, filename in zip(EXPECTED_VOICES, OUTPUT_FILENAMES):
+            file_size = sizes.get(filename)
+            if file_size is not None:
                 total_output_size += file_size
                 
                 # Each voice file should be smaller than original